@@ -157,6 +157,19 @@ def calculer_indicateurs(df, periode_mm_bb, periode_rsi, type_mm, bb_std):
 
     return data
 
+# Facteur d'annualisation
+def estimer_obs_par_an(index_rendements):
+    """Estime le nombre d'observations par an à partir de l'index des rendements (daily ou intraday)."""
+    jours_uniques = pd.Index(index_rendements.date).unique()
+    nb_jours = max(len(jours_uniques), 1)
+
+    annees_rend = max((index_rendements[-1] - index_rendements[0]).total_seconds() / (365.25 * 24 * 3600), 1e-12)
+
+    jours_par_an_estimes = nb_jours / annees_rend if annees_rend > 0 else 252.0
+
+    obs_par_jour = float(pd.Series(1, index=index_rendements).groupby(index_rendements.date).sum().mean()) if nb_jours > 0 else 1.0
+    return max(obs_par_jour * jours_par_an_estimes, 1.0)
+
 # Calcul des métriques
 def calculer_metriques(df, is_daily_data, taux_sans_risque):
     
@@ -201,15 +214,7 @@ def calculer_metriques(df, is_daily_data, taux_sans_risque):
         return metriques
 
     # ---- Estimation automatique du facteur d'annualisation ----
-    jours_uniques = pd.Index(rend.index.date).unique()
-    nb_jours = max(len(jours_uniques), 1)
-
-    annees_rend = max((rend.index[-1] - rend.index[0]).total_seconds() / (365.25 * 24 * 3600), 1e-12)
-
-    jours_par_an_estimes = nb_jours / annees_rend if annees_rend > 0 else 252.0
-
-    obs_par_jour = float(pd.Series(1, index=rend.index).groupby(rend.index.date).sum().mean()) if nb_jours > 0 else 1.0
-    obs_par_an = max(obs_par_jour * jours_par_an_estimes, 1.0)
+    obs_par_an = estimer_obs_par_an(rend.index)
 
     # Volatilité annualisée (%)
     sigma_periodique = float(rend.std())
@@ -224,6 +229,59 @@ def calculer_metriques(df, is_daily_data, taux_sans_risque):
 
     return metriques
 
+# --- Fonctions Portefeuille ---
+def aligner_rendements(donnees_par_ticker, is_daily_data):
+    """Aligne les cours 'Close' de plusieurs tickers sur un index commun et renvoie (prix, rendements)."""
+    closes = {ticker: df['Close'] for ticker, df in donnees_par_ticker.items()}
+    if not is_daily_data:
+        # L'index intraday est en heure locale de chaque place (timezone retirée) :
+        # on ramène chaque ticker à une clôture par date pour ne pas apparier des barres décalées.
+        closes = {ticker: c.groupby(c.index.normalize()).last() for ticker, c in closes.items()}
+    prix = pd.concat(
+        closes,
+        axis=1,
+        join='inner'
+    ).dropna()
+    rendements = prix.pct_change().dropna()
+    return prix, rendements
+
+def calculer_courbe_portefeuille(prix, rendements, poids):
+    """Construit la valeur (base 100) d'un portefeuille rebalancé à chaque période."""
+    rend_portefeuille = rendements.to_numpy() @ np.asarray(poids, dtype=float)
+    valeurs = 100.0 * np.concatenate(([1.0], np.cumprod(1.0 + rend_portefeuille)))
+    return pd.DataFrame({'Close': valeurs}, index=prix.index)
+
+@st.cache_data
+def simuler_frontiere_efficiente(mu, cov, nb_portefeuilles, obs_par_an, taux_sans_risque, graine=42):
+    """
+    Simule des portefeuilles aléatoires (long-only) et calcule rendement, volatilité et Sharpe annualisés.
+    Tous les portefeuilles sont évalués en un seul produit matriciel contre la matrice de covariance.
+    """
+    rng = np.random.default_rng(graine)
+    # Poids aléatoires sur le simplexe (somme = 1, tous positifs)
+    poids = rng.dirichlet(np.ones(len(mu)), size=nb_portefeuilles)
+
+    # Rendement et variance périodiques : w·mu et w'Σw pour chaque ligne de la matrice des poids
+    mu_periodique = poids @ mu
+    variance_periodique = np.einsum('ij,jk,ik->i', poids, cov, poids)
+    sigma_periodique = np.sqrt(np.maximum(variance_periodique, 0.0))
+
+    # Même annualisation que calculer_metriques
+    rf_par_periode = (1.0 + taux_sans_risque) ** (1.0 / obs_par_an) - 1.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(
+            sigma_periodique > 0,
+            (mu_periodique - rf_par_periode) / sigma_periodique * np.sqrt(obs_par_an),
+            np.nan
+        )
+
+    return {
+        'poids': poids,
+        'rendement_moyen': mu_periodique * obs_par_an * 100.0,
+        'volatilite': sigma_periodique * np.sqrt(obs_par_an) * 100.0,
+        'sharpe_ratio': sharpe,
+    }
+
 # --- Interface Utilisateur (Sidebar pour les Inputs) ---
 st.title("📈 Analyse Multi-Actifs")
 st.markdown("""
@@ -482,7 +540,7 @@ with download_placeholder:
 
 st.header(f"Analyse pour {company_name}")
 
-tab1, tab2, tab3 = st.tabs(["📊 Analyse Principale", "🆚 Comparaison", "📋 Données Brutes"])
+tab1, tab2, tab_portefeuille, tab3 = st.tabs(["📊 Analyse Principale", "🆚 Comparaison", "💼 Portefeuille", "📋 Données Brutes"])
 
 with tab1:
     # ... (Le code de l'onglet 1 reste inchangé) ...
@@ -642,6 +700,153 @@ with tab2:
         st.info("Sélectionnez un ou plusieurs 'Tickers de Comparaison' dans la barre latérale pour activer ce graphique.")
 # --------------------------------------------------------------------
 
+with tab_portefeuille:
+    st.subheader("Construction de Portefeuille et Frontière Efficiente")
+
+    donnees_portefeuille = {ticker_principal: data_p, **data_comparaison_dict}
+
+    if len(donnees_portefeuille) < 2:
+        st.info("Sélectionnez au moins un 'Ticker de Comparaison' dans la barre latérale pour construire un portefeuille.")
+    else:
+        prix_pf, rendements_pf = aligner_rendements(donnees_portefeuille, is_daily_data)
+        actifs = list(rendements_pf.columns)
+
+        if len(rendements_pf) < 2:
+            st.warning("Pas assez de dates communes entre les tickers pour construire un portefeuille.")
+        else:
+            obs_par_an_pf = estimer_obs_par_an(rendements_pf.index)
+            mu_pf = rendements_pf.mean().to_numpy()
+            cov_pf = rendements_pf.cov().to_numpy()
+
+            if not is_daily_data:
+                st.caption(
+                    f"Granularité '{choix_intervalle_label}' : les cours sont ramenés à une clôture par date "
+                    "pour aligner des places aux fuseaux horaires différents."
+                )
+
+            col_mode, col_nb = st.columns(2)
+            with col_mode:
+                mode_poids = st.radio(
+                    "Pondération du portefeuille",
+                    ["Poids manuels", "Sharpe maximal", "Volatilité minimale"],
+                    horizontal=True
+                )
+            with col_nb:
+                nb_portefeuilles = st.slider("Nombre de portefeuilles simulés", 5000, 50000, 20000, 5000)
+
+            frontiere = simuler_frontiere_efficiente(mu_pf, cov_pf, nb_portefeuilles, obs_par_an_pf, taux_sans_risque)
+            idx_sharpe_max = int(np.nanargmax(frontiere['sharpe_ratio']))
+            idx_vol_min = int(np.argmin(frontiere['volatilite']))
+
+            # --- Choix des poids ---
+            if mode_poids == "Poids manuels":
+                st.markdown("##### Poids manuels (%)")
+                cols_poids = st.columns(len(actifs))
+                poids_saisis = []
+                for col, actif in zip(cols_poids, actifs):
+                    with col:
+                        poids_saisis.append(st.number_input(
+                            actif, min_value=0.0, max_value=100.0,
+                            value=round(100.0 / len(actifs), 2), step=5.0, key=f"poids_{actif}"
+                        ))
+                poids_saisis = np.array(poids_saisis)
+                if poids_saisis.sum() <= 0:
+                    st.warning("La somme des poids est nulle : pondération égale utilisée.")
+                    poids_pf = np.full(len(actifs), 1.0 / len(actifs))
+                else:
+                    # Normalisation pour que la somme des poids soit égale à 100 %
+                    poids_pf = poids_saisis / poids_saisis.sum()
+            elif mode_poids == "Sharpe maximal":
+                poids_pf = frontiere['poids'][idx_sharpe_max]
+            else:
+                poids_pf = frontiere['poids'][idx_vol_min]
+
+            # --- Métriques du portefeuille (même logique que l'analyse principale) ---
+            courbe_pf = calculer_courbe_portefeuille(prix_pf, rendements_pf, poids_pf)
+            metriques_pf = calculer_metriques(courbe_pf, is_daily_data, taux_sans_risque)
+            # Rendement moyen annualisé : même mesure que l'axe vertical de la frontière
+            rend_moyen_selection = float(poids_pf @ mu_pf) * obs_par_an_pf * 100.0
+
+            col1, col2, col3, col4, col5, col6 = st.columns(6)
+            with col1:
+                st.metric("Performance Cumulée Totale (%)", f"{metriques_pf['rendement_total']:.2f}%")
+            with col2:
+                st.metric("Performance annualisée (%)", f"{metriques_pf['perf_annualisee']:.2f}%")
+            with col3:
+                st.metric("Volatilité Annualisée (%)", f"{metriques_pf['volatilite']:.2f}%")
+            with col4:
+                st.metric("Max Drawdown (%)", f"{metriques_pf['max_drawdown']:.2f}%")
+            with col5:
+                st.metric("Ratio de Sharpe", f"{metriques_pf['sharpe_ratio']:.2f}" if not np.isnan(metriques_pf['sharpe_ratio']) else "N/A")
+            with col6:
+                st.metric("Rendement Moyen Annualisé (%)", f"{rend_moyen_selection:.2f}%")
+
+            st.dataframe(
+                pd.DataFrame({"Poids (%)": poids_pf * 100.0}, index=actifs).T.round(2),
+                use_container_width=True
+            )
+            st.markdown("---")
+
+            # --- Frontière efficiente (Monte Carlo) ---
+            fig_frontiere = go.Figure()
+            fig_frontiere.add_trace(go.Scattergl(
+                x=frontiere['volatilite'], y=frontiere['rendement_moyen'], mode='markers',
+                marker=dict(
+                    size=3, color=frontiere['sharpe_ratio'], colorscale='Viridis',
+                    showscale=True, colorbar=dict(title="Sharpe")
+                ),
+                name="Portefeuilles simulés"
+            ))
+
+            # Actifs individuels
+            vol_actifs = np.sqrt(np.diag(cov_pf) * obs_par_an_pf) * 100.0
+            rend_actifs = mu_pf * obs_par_an_pf * 100.0
+            fig_frontiere.add_trace(go.Scatter(
+                x=vol_actifs, y=rend_actifs, mode='markers+text', text=actifs,
+                textposition="top center", marker=dict(size=10, color="black", symbol="diamond"),
+                name="Actifs"
+            ))
+
+            # Portefeuilles remarquables
+            for idx, label, couleur in [
+                (idx_sharpe_max, "Sharpe maximal", "red"),
+                (idx_vol_min, "Volatilité minimale", "blue"),
+            ]:
+                fig_frontiere.add_trace(go.Scatter(
+                    x=[frontiere['volatilite'][idx]], y=[frontiere['rendement_moyen'][idx]], mode='markers',
+                    marker=dict(size=14, color=couleur, symbol="star"), name=label
+                ))
+
+            # Portefeuille sélectionné
+            vol_selection = float(np.sqrt(poids_pf @ cov_pf @ poids_pf) * np.sqrt(obs_par_an_pf)) * 100.0
+            fig_frontiere.add_trace(go.Scatter(
+                x=[vol_selection], y=[rend_moyen_selection], mode='markers',
+                marker=dict(size=14, color="orange", symbol="x"), name="Portefeuille sélectionné"
+            ))
+
+            fig_frontiere.update_layout(
+                title=f"Frontière Efficiente ({nb_portefeuilles:,} portefeuilles simulés)".replace(",", " "),
+                xaxis_title="Volatilité Annualisée (%)",
+                yaxis_title="Rendement Moyen Annualisé (%)",
+                legend_title_text="Portefeuilles",
+                height=600
+            )
+            st.plotly_chart(fig_frontiere, use_container_width=True)
+
+            # --- Évolution du portefeuille (Base 100) ---
+            fig_courbe_pf = go.Figure()
+            fig_courbe_pf.add_trace(go.Scatter(
+                x=courbe_pf.index, y=courbe_pf['Close'], mode='lines',
+                name="Portefeuille", line=dict(width=3)
+            ))
+            fig_courbe_pf.update_layout(
+                title="Évolution du Portefeuille (Base 100)",
+                xaxis_title="Date",
+                yaxis_title="Valeur (Base 100)",
+                hovermode="x unified"
+            )
+            st.plotly_chart(fig_courbe_pf, use_container_width=True)
+
 with tab3:
     st.subheader(f"📋 Données Historiques et Indicateurs pour {company_name}")
 